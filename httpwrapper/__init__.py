@@ -1,20 +1,50 @@
 import logging
+from collections.abc import Callable
+from functools import partial
 from dataclasses import dataclass
 from io import BufferedReader
 from time import sleep
+from typing import Any
 
-from httpx import Client, RequestError, Response
+import orjson
+from httpx import URL, Client, Limits, Response, TransportError
 
-from .async_ import AsyncClientConfig, BaseAsyncClient
+from .async_ import (
+    AsyncClientConfig,
+    BaseAsyncClient,
+    JitterStrategy,
+    _backoff_delay,
+)
 
 
-@dataclass
+class _RetryStatus(Exception):
+    def __init__(self, response: Response):
+        super().__init__(f"Retryable status: {response.status_code}")
+        self.response = response
+
+
+def _chunks(file: BufferedReader, size: int = 65536):
+    while data := file.read(size):
+        yield data
+
+
+@dataclass(frozen=True, slots=True)
 class ClientConfig:
     retry: int = 99
     timeout: int = 99
-    sleep_time: int = 1
-    sleep_time_increment: int = 3
+    backoff_base: float = 1.0
+    backoff_cap: float = 30.0
+    jitter: JitterStrategy = JitterStrategy.FULL
     follow_redirects: bool = False
+    http2: bool = False
+    max_connections: int = 100
+    max_keepalive_connections: int = 20
+    keepalive_expiry: float = 15.0
+    retry_statuses: frozenset[int] = frozenset({429, 502, 503, 504})
+    serializer: Callable[[Any], bytes] = orjson.dumps
+
+
+_DEFAULT_CONFIG = ClientConfig()
 
 
 class BaseClient:
@@ -26,17 +56,26 @@ class BaseClient:
         auth: tuple[str, str] | None = None,
         config: ClientConfig | None = None,
     ):
-        if host.endswith("/"):
-            host = host[:-1]
-        self.__config = config or ClientConfig()
+        self._base_url = URL(host.rstrip("/"))
+        self.__config = config or _DEFAULT_CONFIG
         self._client = Client(
             auth=auth,
-            base_url=host,
+            base_url=self._base_url,
             headers=headers or None,
             cookies=cookies or None,
             follow_redirects=self.__config.follow_redirects,
+            http2=self.__config.http2,
+            limits=Limits(
+                max_connections=self.__config.max_connections,
+                max_keepalive_connections=self.__config.max_keepalive_connections,
+                keepalive_expiry=self.__config.keepalive_expiry,
+            ),
         )
         self.__logger = logging.getLogger(self.__class__.__name__)
+        self.__req_get = partial(self._request, "GET")
+        self.__req_post = partial(self._request, "POST")
+        self.__req_put = partial(self._request, "PUT")
+        self.__req_delete = partial(self._request, "DELETE")
 
     def _request(
         self,
@@ -48,40 +87,62 @@ class BaseClient:
         content: BufferedReader | None = None,
     ) -> Response:
         config = config or self.__config
-        count, _sleep_time = 0, config.sleep_time
         params, json_data = params or None, json_data or None
+        headers = None
+        stream, stream_offset = None, 0
+        if json_data is not None and content is None:
+            content = config.serializer(json_data)
+            headers = {"Content-Type": "application/json"}
+        elif isinstance(content, BufferedReader):
+            stream, stream_offset = content, content.tell()
 
-        while True:
-            count += 1
+        last_exc: Exception | None = None
+        prev_delay = config.backoff_base
+        for count in range(1, max(config.retry, 1) + 1):
             try:
-                self.__logger.debug(
-                    f"Request: {method.upper()} {url}\n"
-                    f"Params: {params}\n"
-                    f"JSON: {json_data}"
-                )
+                if stream is not None:
+                    # Rewind so a retry re-sends the full body, not an
+                    # exhausted generator.
+                    stream.seek(stream_offset)
+                    content = _chunks(stream)
+                if self.__logger.isEnabledFor(logging.DEBUG):
+                    self.__logger.debug(
+                        f"Request: {method} {url}\n"
+                        f"Params: {params}\n"
+                        f"JSON: {json_data}"
+                    )
                 response = self._client.request(
                     url=url,
                     method=method,
                     params=params,
-                    json=json_data,
                     content=content,
+                    headers=headers,
                     timeout=config.timeout,
                     follow_redirects=config.follow_redirects,
                 )
-                self.__logger.debug(
-                    f"Response: {response.status_code}\n"
-                    f"Content: {response.text[:200]}..."
-                )
+                if self.__logger.isEnabledFor(logging.DEBUG):
+                    self.__logger.debug(
+                        f"Response: {response.status_code}\n"
+                        f"Content: {response.text[:200]}..."
+                    )
+                if response.status_code in config.retry_statuses:
+                    raise _RetryStatus(response)
                 return response
-            except (RequestError, Exception) as e:
+            except (TransportError, _RetryStatus) as e:
+                last_exc = e
                 self.__logger.error(
                     f"Attempt {count}/{config.retry} failed {url}: {str(e)}"
                 )
                 if count >= config.retry:
-                    self.__logger.error(f"Max retries exceeded {url}: {e} ({type(e)})")
-                    raise e
-                sleep(_sleep_time)
-                _sleep_time += config.sleep_time_increment
+                    break
+                prev_delay = _backoff_delay(config, count, prev_delay)
+                sleep(prev_delay)
+        self.__logger.error(
+            f"Max retries exceeded {url}: {last_exc} ({type(last_exc)})"
+        )
+        if isinstance(last_exc, _RetryStatus):
+            return last_exc.response
+        raise last_exc
 
     def _get(
         self,
@@ -89,7 +150,7 @@ class BaseClient:
         params: dict | None = None,
         config: ClientConfig | None = None,
     ) -> Response:
-        return self._request("GET", url, params, config=config)
+        return self.__req_get(url, params, config=config)
 
     def _post(
         self,
@@ -99,7 +160,7 @@ class BaseClient:
         config: ClientConfig | None = None,
         content: BufferedReader | None = None,
     ) -> Response:
-        return self._request("POST", url, params, json_data, config, content)
+        return self.__req_post(url, params, json_data, config, content)
 
     def _put(
         self,
@@ -109,7 +170,7 @@ class BaseClient:
         config: ClientConfig | None = None,
         content: BufferedReader | None = None,
     ) -> Response:
-        return self._request("PUT", url, params, json_data, config, content)
+        return self.__req_put(url, params, json_data, config, content)
 
     def _delete(
         self,
@@ -117,7 +178,13 @@ class BaseClient:
         params: dict | None = None,
         config: ClientConfig | None = None,
     ) -> Response:
-        return self._request("DELETE", url, params, config=config)
+        return self.__req_delete(url, params, config=config)
 
 
-__all__ = ["BaseClient", "ClientConfig", "BaseAsyncClient", "AsyncClientConfig"]
+__all__ = [
+    "BaseClient",
+    "ClientConfig",
+    "BaseAsyncClient",
+    "AsyncClientConfig",
+    "JitterStrategy",
+]
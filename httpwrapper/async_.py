@@ -1,21 +1,76 @@
 import asyncio
-import contextlib
 import logging
-from dataclasses import dataclass
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
+from enum import Enum
+from functools import partial
 from io import BufferedReader
-from time import sleep
+from random import Random
+from typing import Any
 
-from aiohttp import BasicAuth, ClientResponse, ClientSession, ClientTimeout
+import orjson
+from aiohttp import (
+    BasicAuth,
+    ClientConnectionError,
+    ClientResponse,
+    ClientSession,
+    ClientTimeout,
+    TCPConnector,
+)
+from yarl import URL
 
 
-@dataclass
+_jitter = Random()
+
+
+class JitterStrategy(Enum):
+    NONE = 0
+    FULL = 1
+    EQUAL = 2
+    DECORRELATED = 3
+
+
+def _backoff_delay(config, count: int, prev_delay: float) -> float:
+    exp = min(config.backoff_cap, config.backoff_base * 2 ** (count - 1))
+    if config.jitter is JitterStrategy.NONE:
+        return exp
+    if config.jitter is JitterStrategy.EQUAL:
+        return exp / 2 + _jitter.uniform(0, exp / 2)
+    if config.jitter is JitterStrategy.DECORRELATED:
+        return min(config.backoff_cap, _jitter.uniform(config.backoff_base, prev_delay * 3))
+    return _jitter.uniform(0, exp)
+
+
+class _RetryStatus(Exception):
+    def __init__(self, response: ClientResponse):
+        super().__init__(f"Retryable status: {response.status}")
+        self.response = response
+
+
+async def _chunks(file: BufferedReader, size: int = 65536):
+    loop = asyncio.get_running_loop()
+    while data := await loop.run_in_executor(None, file.read, size):
+        yield data
+
+
+@dataclass(frozen=True, slots=True)
 class AsyncClientConfig:
     retry: int = 99
-    timeout: ClientTimeout = ClientTimeout(total=99)
-    sleep_time: int = 1
-    sleep_time_increment: int = 3
+    timeout: ClientTimeout = field(default_factory=lambda: ClientTimeout(total=99))
+    backoff_base: float = 1.0
+    backoff_cap: float = 30.0
+    jitter: JitterStrategy = JitterStrategy.FULL
     allow_redirects: bool = False
     proxy: str | None = None
+    limit: int = 100
+    limit_per_host: int = 20
+    keepalive_timeout: float = 75.0
+    ttl_dns_cache: int = 300
+    retry_statuses: frozenset[int] = frozenset({429, 502, 503, 504})
+    serializer: Callable[[Any], bytes] = orjson.dumps
+
+
+_DEFAULT_CONFIG = AsyncClientConfig()
 
 
 class BaseAsyncClient:
@@ -27,21 +82,30 @@ class BaseAsyncClient:
         auth: tuple[str, str] | None = None,
         config: AsyncClientConfig | None = None,
     ):
-        if not host.endswith("/"):
-            host = host + "/"
+        self._base_url = URL(host if host.endswith("/") else host + "/")
         basic_auth = BasicAuth(auth[0], auth[1]) if auth else None
-        self.__config = config or AsyncClientConfig()
-        self.__connector = None
+        self.__config = config or _DEFAULT_CONFIG
+        self.__connector = TCPConnector(
+            limit=self.__config.limit,
+            limit_per_host=self.__config.limit_per_host,
+            keepalive_timeout=self.__config.keepalive_timeout,
+            ttl_dns_cache=self.__config.ttl_dns_cache,
+            enable_cleanup_closed=True,
+        )
         self._client = ClientSession(
-            base_url=host,
             auth=basic_auth,
             headers=headers or None,
             cookies=cookies or None,
             connector=self.__connector,
             proxy=self.__config.proxy or None,
         )
+        self.__url_cache: dict[str, URL] = {}
         self.__logger = logging.getLogger(self.__class__.__name__)
         self.__logger.debug(f"Proxy: {self.__config.proxy}")
+        self.__req_get = partial(self._request, "GET")
+        self.__req_post = partial(self._request, "POST")
+        self.__req_put = partial(self._request, "PUT")
+        self.__req_delete = partial(self._request, "DELETE")
 
     async def _request(
         self,
@@ -52,39 +116,66 @@ class BaseAsyncClient:
         data: BufferedReader | None = None,
         config: AsyncClientConfig | None = None,
     ) -> ClientResponse:
-        if url.startswith("/"):
-            url = url[1:]
+        if len(self.__url_cache) > 4096:
+            self.__url_cache.clear()
+        full_url = self.__url_cache.get(url)
+        if full_url is None:
+            full_url = self.__url_cache[url] = self._base_url.join(
+                URL(url.lstrip("/"))
+            )
         config = config or self.__config
-        count, _sleep_time = 0, config.sleep_time
         params, json_data = params or None, json_data or None
+        headers = None
+        stream, stream_offset = None, 0
+        if json_data is not None and data is None:
+            data = config.serializer(json_data)
+            headers = {"Content-Type": "application/json"}
+        elif isinstance(data, BufferedReader):
+            stream, stream_offset = data, data.tell()
 
-        while True:
-            count += 1
+        last_exc: Exception | None = None
+        prev_delay = config.backoff_base
+        for count in range(1, max(config.retry, 1) + 1):
             try:
-                message = f"Request: {method.upper()} {url}\nParams: {params}"
-                if json_data:
-                    message += f"\nJSON: {json_data}"
-                if self.__config.proxy:
-                    message += f"\nProxy: {self.__config.proxy}"
-                self.__logger.debug(message)
-                return await self._client.request(
-                    url=url,
+                if stream is not None:
+                    # Rewind so a retry re-sends the full body, not an
+                    # exhausted generator.
+                    stream.seek(stream_offset)
+                    data = _chunks(stream)
+                if self.__logger.isEnabledFor(logging.DEBUG):
+                    message = f"Request: {method} {url}\nParams: {params}"
+                    if json_data:
+                        message += f"\nJSON: {json_data}"
+                    if self.__config.proxy:
+                        message += f"\nProxy: {self.__config.proxy}"
+                    self.__logger.debug(message)
+                response = await self._client.request(
+                    url=full_url,
                     data=data,
                     method=method,
                     params=params,
-                    json=json_data,
+                    headers=headers,
                     timeout=config.timeout,
                     allow_redirects=config.allow_redirects,
                 )
-            except Exception as e:
+                if response.status in config.retry_statuses:
+                    raise _RetryStatus(response)
+                return response
+            except (ClientConnectionError, asyncio.TimeoutError, _RetryStatus) as e:
+                last_exc = e
                 self.__logger.error(
                     f"Attempt {count}/{config.retry} failed {url}: {str(e)}"
                 )
                 if count >= config.retry:
-                    self.__logger.error(f"Max retries exceeded {url}: {e} ({type(e)})")
-                    raise e
-                sleep(_sleep_time)
-                _sleep_time += config.sleep_time_increment
+                    break
+                prev_delay = _backoff_delay(config, count, prev_delay)
+                await asyncio.sleep(prev_delay)
+        self.__logger.error(
+            f"Max retries exceeded {url}: {last_exc} ({type(last_exc)})"
+        )
+        if isinstance(last_exc, _RetryStatus):
+            return last_exc.response
+        raise last_exc
 
     async def _get(
         self,
@@ -92,7 +183,23 @@ class BaseAsyncClient:
         params: dict | None = None,
         config: AsyncClientConfig | None = None,
     ) -> ClientResponse:
-        return await self._request("GET", url, params, config=config)
+        return await self.__req_get(url, params, config=config)
+
+    async def _get_many(
+        self,
+        urls: Iterable[str],
+        params: list[dict | None] | None = None,
+        config: AsyncClientConfig | None = None,
+    ) -> list[ClientResponse | BaseException]:
+        # Concurrency is bounded by the connector's limit_per_host; batches
+        # much larger than that only queue inside the pool.
+        urls = list(urls)
+        params = params or [None] * len(urls)
+        tasks = [
+            self._request("GET", url, p, config=config)
+            for url, p in zip(urls, params)
+        ]
+        return await asyncio.gather(*tasks, return_exceptions=True)
 
     async def _post(
         self,
@@ -102,7 +209,7 @@ class BaseAsyncClient:
         data: BufferedReader | None = None,
         config: AsyncClientConfig | None = None,
     ) -> ClientResponse:
-        return await self._request("POST", url, params, json_data, data, config)
+        return await self.__req_post(url, params, json_data, data, config)
 
     async def _put(
         self,
@@ -112,7 +219,7 @@ class BaseAsyncClient:
         data: BufferedReader | None = None,
         config: AsyncClientConfig | None = None,
     ) -> ClientResponse:
-        return await self._request("PUT", url, params, json_data, data, config)
+        return await self.__req_put(url, params, json_data, data, config)
 
     async def _delete(
         self,
@@ -120,15 +227,13 @@ class BaseAsyncClient:
         params: dict | None = None,
         config: AsyncClientConfig | None = None,
     ) -> ClientResponse:
-        return await self._request("DELETE", url, params, config=config)
+        return await self.__req_delete(url, params, config=config)
 
     async def close(self):
         await self._client.close()
 
-    def __del__(self):
-        with contextlib.suppress(Exception):
-            loop = asyncio.get_event_loop()
-            if loop.is_running():
-                loop.create_task(self.close())
-            else:
-                loop.run_until_complete(self.close())
+    async def __aenter__(self) -> "BaseAsyncClient":
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        await self.close()
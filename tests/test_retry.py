@@ -0,0 +1,170 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+from httpx import ConnectError, Response
+
+import httpwrapper
+from httpwrapper import (
+    AsyncClientConfig,
+    BaseAsyncClient,
+    BaseClient,
+    ClientConfig,
+    JitterStrategy,
+)
+from httpwrapper.async_ import _backoff_delay
+
+
+class SyncClient(BaseClient):
+    def get(self, config):
+        return self._get("/x", config=config)
+
+
+class AsyncClient(BaseAsyncClient):
+    async def get(self, config):
+        return await self._get("/x", config=config)
+
+
+@pytest.fixture()
+def sync_sleeps(monkeypatch):
+    sleeps = []
+    monkeypatch.setattr(httpwrapper, "sleep", sleeps.append)
+    return sleeps
+
+
+@pytest.fixture()
+def async_sleeps(monkeypatch):
+    sleeps = []
+
+    async def sleep(delay):
+        sleeps.append(delay)
+
+    monkeypatch.setattr(
+        httpwrapper.async_,
+        "asyncio",
+        SimpleNamespace(
+            sleep=sleep,
+            TimeoutError=asyncio.TimeoutError,
+            gather=asyncio.gather,
+            get_running_loop=asyncio.get_running_loop,
+        ),
+    )
+    return sleeps
+
+
+def _stub_sync(client, responses):
+    calls = []
+
+    def request(**kwargs):
+        calls.append(kwargs)
+        result = responses[min(len(calls), len(responses)) - 1]
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    client._client = SimpleNamespace(request=request)
+    return calls
+
+
+async def _stub_async(client, responses):
+    await client._client.close()
+    calls = []
+
+    async def request(**kwargs):
+        calls.append(kwargs)
+        result = responses[min(len(calls), len(responses)) - 1]
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    client._client = SimpleNamespace(request=request)
+    return calls
+
+
+def test_sync_non_transient_error_propagates_without_retry(sync_sleeps):
+    client = SyncClient("http://host")
+    calls = _stub_sync(client, [ValueError("not transient")])
+    with pytest.raises(ValueError):
+        client.get(ClientConfig(retry=5))
+    assert len(calls) == 1
+    assert sync_sleeps == []
+
+
+def test_sync_retry_status_then_final_response(sync_sleeps):
+    client = SyncClient("http://host")
+    calls = _stub_sync(client, [Response(503), Response(200)])
+    response = client.get(ClientConfig(retry=5))
+    assert response.status_code == 200
+    assert len(calls) == 2
+    assert len(sync_sleeps) == 1
+
+
+def test_sync_exhausted_retry_statuses_return_last_response(sync_sleeps):
+    client = SyncClient("http://host")
+    calls = _stub_sync(client, [Response(503)])
+    response = client.get(ClientConfig(retry=3))
+    assert response.status_code == 503
+    assert len(calls) == 3
+    assert len(sync_sleeps) == 2
+
+
+def test_sync_no_sleep_before_terminal_failure(sync_sleeps):
+    client = SyncClient("http://host")
+    calls = _stub_sync(client, [ConnectError("boom")])
+    with pytest.raises(ConnectError):
+        client.get(ClientConfig(retry=1))
+    assert len(calls) == 1
+    assert sync_sleeps == []
+
+
+@pytest.mark.asyncio
+async def test_async_non_transient_error_propagates_without_retry(async_sleeps):
+    client = AsyncClient("http://host")
+    calls = await _stub_async(client, [ValueError("not transient")])
+    with pytest.raises(ValueError):
+        await client.get(AsyncClientConfig(retry=5))
+    assert len(calls) == 1
+    assert async_sleeps == []
+
+
+@pytest.mark.asyncio
+async def test_async_retry_status_then_final_response(async_sleeps):
+    client = AsyncClient("http://host")
+    calls = await _stub_async(
+        client, [SimpleNamespace(status=503), SimpleNamespace(status=200)]
+    )
+    response = await client.get(AsyncClientConfig(retry=5))
+    assert response.status == 200
+    assert len(calls) == 2
+    assert len(async_sleeps) == 1
+
+
+@pytest.mark.asyncio
+async def test_async_exhausted_retry_statuses_return_last_response(async_sleeps):
+    client = AsyncClient("http://host")
+    calls = await _stub_async(client, [SimpleNamespace(status=503)])
+    response = await client.get(AsyncClientConfig(retry=3))
+    assert response.status == 503
+    assert len(calls) == 3
+    assert len(async_sleeps) == 2
+
+
+@pytest.mark.parametrize("strategy", list(JitterStrategy))
+def test_backoff_delay_stays_within_cap(strategy):
+    config = ClientConfig(jitter=strategy, backoff_base=1.0, backoff_cap=30.0)
+    prev_delay = config.backoff_base
+    for count in range(1, 20):
+        prev_delay = _backoff_delay(config, count, prev_delay)
+        assert 0 <= prev_delay <= config.backoff_cap
+
+
+def test_backoff_delay_without_jitter_is_exponential():
+    config = ClientConfig(jitter=JitterStrategy.NONE, backoff_base=1.0, backoff_cap=30.0)
+    assert [_backoff_delay(config, count, 1.0) for count in range(1, 7)] == [
+        1.0,
+        2.0,
+        4.0,
+        8.0,
+        16.0,
+        30.0,
+    ]
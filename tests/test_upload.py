@@ -0,0 +1,80 @@
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+from aiohttp import ClientTimeout
+
+from httpwrapper import AsyncClientConfig, BaseAsyncClient, BaseClient, ClientConfig
+
+
+@pytest.fixture()
+def upload_server():
+    bodies = []
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_POST(self):
+            if "chunked" in (self.headers.get("Transfer-Encoding") or ""):
+                body = b""
+                while True:
+                    size = int(self.rfile.readline().strip(), 16)
+                    if size == 0:
+                        self.rfile.readline()
+                        break
+                    body += self.rfile.read(size)
+                    self.rfile.readline()
+            else:
+                body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+            bodies.append(body)
+            self.send_response(503 if len(bodies) == 1 else 200)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_port}", bodies
+    server.shutdown()
+
+
+def test_sync_stream_body_is_replayed_on_retry(upload_server, tmp_path):
+    host, bodies = upload_server
+    payload = b"x" * 200_000
+    path = tmp_path / "upload.bin"
+    path.write_bytes(payload)
+
+    class Client(BaseClient):
+        def upload(self, file):
+            return self._post("/upload", content=file)
+
+    config = ClientConfig(retry=3, timeout=5, backoff_cap=0.01)
+    with path.open("rb") as file:
+        response = Client(host, config=config).upload(file)
+
+    assert response.status_code == 200
+    assert bodies == [payload, payload]
+
+
+@pytest.mark.asyncio
+async def test_async_stream_body_is_replayed_on_retry(upload_server, tmp_path):
+    host, bodies = upload_server
+    payload = b"x" * 200_000
+    path = tmp_path / "upload.bin"
+    path.write_bytes(payload)
+
+    class Client(BaseAsyncClient):
+        async def upload(self, file):
+            return await self._post("/upload", data=file)
+
+    config = AsyncClientConfig(
+        retry=3, timeout=ClientTimeout(total=5), backoff_cap=0.01
+    )
+    async with Client(host, config=config) as client:
+        with path.open("rb") as file:
+            response = await client.upload(file)
+
+    assert response.status == 200
+    assert bodies == [payload, payload]